@@ -1,5 +1,10 @@
+from collections import Counter
+
+import orjson
+from fastapi.responses import StreamingResponse
+
 from app.services.prune import prune_comments
-from app.services.comment_inference import analyze_comments
+from app.services.comment_inference import analyze_comments, analyze_comments_stream
 
 async def comment_analysis_handler(payload: dict) -> dict:
 
@@ -32,6 +37,64 @@ async def comment_analysis_handler(payload: dict) -> dict:
 
     return res
 
+
+async def comment_analysis_stream_handler(payload: dict) -> StreamingResponse:
+    """
+    NDJSON variant of comment analysis: one pruning_info line up front, one
+    line per analysis as its batch completes, and a final stats line.
+
+    Streaming overlaps the network send with analysis production and keeps
+    the server from holding the whole serialized payload in memory.
+    """
+    comments = payload.get("comments", [])
+    min_length = payload.get("min_length", 10)
+    product_context = payload.get("product_context")
+    batch_size = payload.get("batch_size", 20)
+
+    kept_comments = prune_comments(comments, min_length)
+
+    async def gen():
+        yield orjson.dumps({
+            "type": "pruning_info",
+            "kept_comments": kept_comments,
+            "stats": {
+                "total": len(comments),
+                "kept": len(kept_comments),
+            }
+        }) + b"\n"
+
+        sentiments = Counter()
+        topics = set()
+        issues_found = 0
+        total_analyzed = 0
+        async for analysis in analyze_comments_stream(
+            kept_comments,
+            product_context=product_context,
+            batch_size=batch_size
+        ):
+            sentiments[analysis["product_sentiment"]] += 1
+            topics.add(analysis["topic"])
+            issues_found += analysis["has_issue"]
+            total_analyzed += 1
+            yield orjson.dumps({"type": "analysis", **analysis}) + b"\n"
+
+        # Stats depend on every analysis, so they close the stream
+        yield orjson.dumps({
+            "type": "stats",
+            "stats": {
+                "total_analyzed": total_analyzed,
+                "sentiment_breakdown": {
+                    sentiment: sentiments.get(sentiment, 0)
+                    for sentiment in ("positive", "negative", "neutral", "mixed")
+                },
+                "issues_found": issues_found,
+                "unique_topics": len(topics)
+            }
+        }) + b"\n"
+
+    return StreamingResponse(gen(), media_type="application/x-ndjson")
+
+
 def video_analysis_handler(payload: dict):
     # TODO: Implement video analysis
     return {}
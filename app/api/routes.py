@@ -1,6 +1,7 @@
 from fastapi import APIRouter
 from app.api.handlers import (
     comment_analysis_handler,
+    comment_analysis_stream_handler,
     video_analysis_handler
 )
 
@@ -18,7 +19,13 @@ async def analyze_comments(payload: dict):
     return await comment_analysis_handler(payload)
 
 
+# Comment analysis, streamed as NDJSON
+@router.post("/analyze-comments/stream")
+async def analyze_comments_stream(payload: dict):
+    return await comment_analysis_stream_handler(payload)
+
+
 # vid analysis
 @router.post("/analyze-video")
 def analyze_video(payload: dict):
-    return
\ No newline at end of file
+    return video_analysis_handler(payload)
\ No newline at end of file
@@ -1,8 +1,24 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from app.api.routes import router
+from app.services.comment_inference import BatchAnalysisResult
+from app.util.unwrap_openai import close_openai_client, get_openai_client
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Warm the cold path at startup so the first request doesn't pay for it:
+    # build the shared OpenAI client and compile the Pydantic core schema
+    app.state.openai_client = get_openai_client()
+    BatchAnalysisResult.model_rebuild()
+    yield
+    await close_openai_client()
+
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 origins = [
     "http://localhost",
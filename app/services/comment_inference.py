@@ -1,7 +1,12 @@
+import asyncio
+from collections import Counter
+from itertools import chain
 from typing import List, Dict, Optional
-from pydantic import BaseModel, Field
+from openai import pydantic_function_tool
+from pydantic import BaseModel, ConfigDict, Field
 from enum import Enum
 
+from app.services.llm_cache import content_key, llm_cache
 from app.util.unwrap_openai import create_openai_completion, GPT5Deployment, ReasoningEffort
 
 
@@ -15,6 +20,8 @@ class SentimentType(str, Enum):
 class CommentAnalysisResult(BaseModel):
     """Structured analysis result for a single comment."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     comment_index: int = Field(..., description="The index of the comment in the batch (0-indexed)")
     product_sentiment: SentimentType = Field(..., description="Sentiment specifically about the product, not just general sentiment")
     has_issue: bool = Field(..., description="Whether this comment mentions a specific issue with the product")
@@ -25,9 +32,32 @@ class CommentAnalysisResult(BaseModel):
 class BatchAnalysisResult(BaseModel):
     """Analysis results for a batch of comments."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     analyses: List[CommentAnalysisResult] = Field(..., description="List of individual comment analyses")
 
 
+# Rough character budget per prompt when growing batches; bigger batches mean
+# fewer round-trips and fewer rate-limit stalls, as long as prompts stay small
+TARGET_PROMPT_CHARS = 6000
+MAX_BATCH_SIZE = 64
+
+# Static across all calls; keeping these byte-identical lets the backend's
+# prefix KV cache hit on the system prompt and tool schema every time
+_SYSTEM_PROMPT = """You are an expert at analyzing YouTube comments about products/videos.
+Your task is to extract structured information from each comment:
+
+1. PRODUCT SENTIMENT: Focus specifically on how the commenter feels about the PRODUCT/VIDEO itself, not their general mood. Look for opinions about features, quality, usefulness, etc.
+
+2. ISSUE IDENTIFICATION: Only mark has_issue=True if the comment explicitly mentions a problem, bug, complaint, or negative experience with the product. Be specific in describing the issue.
+
+3. TOPIC CATEGORIZATION: Identify the main topic/theme of the comment as it relates to the product. Examples: "feature request", "bug report", "pricing", "performance", "UI/UX", "comparison", "tutorial request", "general praise", etc.
+
+Keep outputs concise and deterministic. Be precise and consistent in categorization."""
+
+_TOOLS = [pydantic_function_tool(BatchAnalysisResult)]
+
+
 async def analyze_comments_batch(
     comments: List[str],
     product_context: Optional[str] = None,
@@ -39,20 +69,56 @@ async def analyze_comments_batch(
     Args:
         comments: List of comment strings to analyze
         product_context: Optional context about what product/video these comments are for
-        batch_size: Number of comments to process in each LLM call (default 20)
+        batch_size: Minimum number of comments per LLM call; grown adaptively
+            for short comments to cut round-trips (default 20)
 
     Returns:
         List of analysis dictionaries containing sentiment, issues, and topics
     """
-    all_results = []
+    # gather preserves input order, so start_index math stays correct
+    tasks = _build_batch_tasks(comments, product_context, batch_size)
+    results = await asyncio.gather(*tasks)
+
+    return list(chain.from_iterable(results))
 
-    # Process comments in batches
-    for i in range(0, len(comments), batch_size):
-        batch = comments[i:i+batch_size]
-        batch_results = await _analyze_single_batch(batch, i, product_context)
-        all_results.extend(batch_results)
 
-    return all_results
+async def analyze_comments_stream(
+    comments: List[str],
+    product_context: Optional[str] = None,
+    batch_size: int = 50
+):
+    """
+    Yield analysis dicts as each batch's LLM call completes.
+
+    Unlike analyze_comments_batch, results arrive in completion order rather
+    than input order; each dict carries its own original_index. This lets
+    callers start aggregating (or streaming to the client) while later
+    batches are still in flight.
+    """
+    tasks = _build_batch_tasks(comments, product_context, batch_size)
+    for next_batch in asyncio.as_completed(tasks):
+        for analysis in await next_batch:
+            yield analysis
+
+
+def _build_batch_tasks(
+    comments: List[str],
+    product_context: Optional[str],
+    batch_size: int
+) -> List:
+    """Slice comments into adaptively sized batches, one coroutine per batch."""
+    # Grow the batch size for short comments so total prompt chars stay near
+    # the target budget with as few round-trips as possible; the calls are
+    # independent and I/O-bound, and create_openai_completion already caps
+    # concurrency with a semaphore.
+    if comments:
+        avg_len = sum(map(len, comments)) / len(comments)
+        batch_size = max(batch_size, min(MAX_BATCH_SIZE, int(TARGET_PROMPT_CHARS / max(1, avg_len))))
+
+    return [
+        _analyze_single_batch(comments[i:i+batch_size], i, product_context)
+        for i in range(0, len(comments), batch_size)
+    ]
 
 
 async def _analyze_single_batch(
@@ -62,6 +128,17 @@ async def _analyze_single_batch(
 ) -> List[Dict]:
     """Analyze a single batch of comments with structured output."""
 
+    # Identical batches (same comments + context + model) give stable results
+    # with minimal reasoning and forced structured output, so reuse them
+    cache_key = content_key({
+        "m": GPT5Deployment.GPT_5_NANO.value,
+        "ctx": product_context,
+        "b": batch,
+    })
+    cached = await llm_cache.get(cache_key)
+    if cached is not None:
+        return _format_batch_results(BatchAnalysisResult.model_validate(cached), batch, start_index)
+
     # Format comments with indices
     formatted_comments = "\n".join([
         f"[{idx}] {comment}"
@@ -74,16 +151,7 @@ async def _analyze_single_batch(
     messages = [
         {
             "role": "system",
-            "content": """You are an expert at analyzing YouTube comments about products/videos.
-Your task is to extract structured information from each comment:
-
-1. PRODUCT SENTIMENT: Focus specifically on how the commenter feels about the PRODUCT/VIDEO itself, not their general mood. Look for opinions about features, quality, usefulness, etc.
-
-2. ISSUE IDENTIFICATION: Only mark has_issue=True if the comment explicitly mentions a problem, bug, complaint, or negative experience with the product. Be specific in describing the issue.
-
-3. TOPIC CATEGORIZATION: Identify the main topic/theme of the comment as it relates to the product. Examples: "feature request", "bug report", "pricing", "performance", "UI/UX", "comparison", "tutorial request", "general praise", etc.
-
-Keep outputs concise and deterministic. Be precise and consistent in categorization."""
+            "content": _SYSTEM_PROMPT
         },
         {
             "role": "user",
@@ -98,7 +166,7 @@ Keep outputs concise and deterministic. Be precise and consistent in categorizat
         messages=messages,
         model=GPT5Deployment.GPT_5_NANO,
         reasoning_effort=ReasoningEffort.MINIMAL,
-        tools=[BatchAnalysisResult],
+        tools=_TOOLS,
         tool_choice="required",
         max_completion_tokens=4096
     )
@@ -106,26 +174,38 @@ Keep outputs concise and deterministic. Be precise and consistent in categorizat
     # Parse tool call response
     if response.choices[0].message.tool_calls:
         tool_call = response.choices[0].message.tool_calls[0]
-        import json
-        result_data = json.loads(tool_call.function.arguments)
-        batch_result = BatchAnalysisResult(**result_data)
-
-        # Convert to list of dicts with absolute indices
-        return [
-            {
-                "comment": batch[analysis.comment_index],
-                "original_index": start_index + analysis.comment_index,
-                "product_sentiment": analysis.product_sentiment,
-                "has_issue": analysis.has_issue,
-                "issue_description": analysis.issue_description,
-                "topic": analysis.topic
-            }
-            for analysis in batch_result.analyses
-        ]
+        arguments = tool_call.function.arguments
+        if isinstance(arguments, (str, bytes)):
+            # Single-pass parse+validate straight from the JSON string
+            batch_result = BatchAnalysisResult.model_validate_json(arguments)
+        else:
+            batch_result = BatchAnalysisResult.model_validate(arguments)
+
+        await llm_cache.set(cache_key, batch_result.model_dump())
+        return _format_batch_results(batch_result, batch, start_index)
 
     return []
 
 
+def _format_batch_results(
+    batch_result: BatchAnalysisResult,
+    batch: List[str],
+    start_index: int
+) -> List[Dict]:
+    """Convert a batch result to a list of dicts with absolute indices."""
+    # Dump the whole batch in one pass through pydantic-core instead of
+    # five attribute reads per analysis, then patch in the absolute index.
+    # JSON mode flattens SentimentType to a plain str, so downstream
+    # aggregation and serialization never touch StrEnum.__eq__
+    results = []
+    for analysis in batch_result.model_dump(mode="json")["analyses"]:
+        comment_index = analysis.pop("comment_index")
+        analysis["comment"] = batch[comment_index]
+        analysis["original_index"] = start_index + comment_index
+        results.append(analysis)
+    return results
+
+
 async def analyze_comments(
     comments: List[str],
     product_context: Optional[str] = None,
@@ -138,19 +218,41 @@ async def analyze_comments(
     - analyses: List of individual comment analyses
     - stats: Aggregated statistics about sentiments, issues, topics
     """
-    analyses = await analyze_comments_batch(comments, product_context, batch_size)
+    # Duplicates are common on YouTube (copy-paste spam, "first!" style
+    # comments); analyze each unique comment once and fan the result back out
+    # so they don't cost extra rows in the LLM prompts
+    duplicate_indices: Dict[str, List[int]] = {}
+    for i, comment in enumerate(comments):
+        duplicate_indices.setdefault(comment.strip(), []).append(i)
+
+    # Consume batches as they complete so fan-out and stats aggregation
+    # overlap with the LLM calls still in flight
+    analyses = []
+    sentiments = Counter()
+    topics = set()
+    issues_found = 0
+    async for analysis in analyze_comments_stream(
+        list(duplicate_indices), product_context, batch_size
+    ):
+        indices = duplicate_indices[analysis["comment"]]
+        sentiments[analysis["product_sentiment"]] += len(indices)
+        topics.add(analysis["topic"])
+        issues_found += analysis["has_issue"] * len(indices)
+        for i in indices:
+            expanded = dict(analysis)
+            expanded["comment"] = comments[i]
+            expanded["original_index"] = i
+            analyses.append(expanded)
+    analyses.sort(key=lambda a: a["original_index"])
 
-    # Compute aggregate stats
     stats = {
         "total_analyzed": len(analyses),
         "sentiment_breakdown": {
-            "positive": sum(1 for a in analyses if a["product_sentiment"] == "positive"),
-            "negative": sum(1 for a in analyses if a["product_sentiment"] == "negative"),
-            "neutral": sum(1 for a in analyses if a["product_sentiment"] == "neutral"),
-            "mixed": sum(1 for a in analyses if a["product_sentiment"] == "mixed"),
+            sentiment: sentiments.get(sentiment, 0)
+            for sentiment in ("positive", "negative", "neutral", "mixed")
         },
-        "issues_found": sum(1 for a in analyses if a["has_issue"]),
-        "unique_topics": len(set(a["topic"] for a in analyses))
+        "issues_found": issues_found,
+        "unique_topics": len(topics)
     }
 
     return {
@@ -0,0 +1,61 @@
+import hashlib
+import json
+import os
+import time
+from typing import Any, Dict, Optional
+
+
+def content_key(payload: Any) -> str:
+    """Build a stable cache key from any JSON-serializable payload."""
+    serialized = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(serialized.encode()).hexdigest()
+
+
+class LLMCache:
+    """
+    In-process TTL cache for deterministic LLM responses.
+
+    Responses from structured-output calls with reasoning_effort=minimal are
+    stable enough to reuse, so identical batches (common during development,
+    retries, and re-runs on the same video) skip the network round-trip
+    entirely. The interface is async so a shared backend (e.g. Redis) can be
+    swapped in later without touching call sites.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 3600,
+        max_entries: int = 1024,
+        enabled: Optional[bool] = None,
+    ):
+        if enabled is None:
+            enabled = os.getenv("LLM_CACHE_ENABLED", "1").lower() not in ("0", "false")
+        self.enabled = enabled
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._store: Dict[str, tuple[float, Any]] = {}
+
+    async def get(self, key: str) -> Optional[Any]:
+        if not self.enabled:
+            return None
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._store[key]
+            return None
+        return value
+
+    async def set(self, key: str, value: Any) -> None:
+        if not self.enabled:
+            return
+        if len(self._store) >= self.max_entries:
+            # Evict the entry closest to expiry to stay bounded
+            oldest = min(self._store, key=lambda k: self._store[k][0])
+            del self._store[oldest]
+        self._store[key] = (time.monotonic() + self.ttl_seconds, value)
+
+
+# Shared process-wide cache instance
+llm_cache = LLMCache()
@@ -1,16 +1,12 @@
+import random
 from typing import List, Tuple
-import numpy as np
 
 def prune_comments(comments: List[str], min_length: int = 20) -> List[str]:
-    kept_comments = []
-
-    # Take simple random sample
+    # Take simple random sample by index; O(sample_size) instead of
+    # materializing every comment into an array first
     sample_size = min(20, len(comments))
-    comments = np.random.choice(comments, size=sample_size, replace=False)
+    idx = random.sample(range(len(comments)), sample_size)
+    sampled = [comments[i] for i in idx]
 
     # Length pruning
-    for comment in comments:
-        if len(comment.strip()) >= min_length:
-            kept_comments.append(comment)
-
-    return kept_comments
\ No newline at end of file
+    return [comment for comment in sampled if len(comment.strip()) >= min_length]
@@ -7,6 +7,7 @@
 import asyncio
 import os
 from typing import List, Dict, Optional, Any
+import httpx
 from openai import AsyncAzureOpenAI, pydantic_function_tool
 from openai.types.chat import ChatCompletion
 from pydantic import BaseModel, Field
@@ -39,13 +40,42 @@ subscription_key = os.getenv("SUBSCRIPTION_KEY")
 # Semaphore to limit concurrent OpenAI calls to 20
 _openai_semaphore = asyncio.Semaphore(20)
 
+# Shared client so TLS setup and connection pooling are paid once per process
+_openai_client: Optional[AsyncAzureOpenAI] = None
+
+
+def get_openai_client() -> AsyncAzureOpenAI:
+    """Return the shared AsyncAzureOpenAI client, creating it on first use."""
+    global _openai_client
+    if _openai_client is None:
+        # HTTP/2 multiplexes the concurrent batch calls over pooled
+        # connections, so TLS setup is amortized across the whole process
+        _openai_client = AsyncAzureOpenAI(
+            api_version="2024-12-01-preview",
+            azure_endpoint=endpoint,
+            api_key=subscription_key,
+            http_client=httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            ),
+        )
+    return _openai_client
+
+
+async def close_openai_client() -> None:
+    """Close the shared client (called on app shutdown)."""
+    global _openai_client
+    if _openai_client is not None:
+        await _openai_client.close()
+        _openai_client = None
+
 
 async def create_openai_completion(
     messages: List[Dict[str, str]],
     model: GPT5Deployment = GPT5Deployment.GPT_5_NANO,
     reasoning_effort: ReasoningEffort = ReasoningEffort.MINIMAL,
     max_completion_tokens: int = 16384,
-    tools: Optional[List[type[BaseModel]]] = None,
+    tools: Optional[List[type[BaseModel] | Dict[str, Any]]] = None,
     tool_choice: Optional[str | Dict[str, Any]] = None,
     client: Optional[AsyncAzureOpenAI] = None,
 ) -> ChatCompletion:
@@ -57,7 +87,8 @@ async def create_openai_completion(
         model: GPT model deployment to use
         reasoning_effort: Reasoning effort level
         max_completion_tokens: Maximum tokens in completion
-        tools: Optional list of Pydantic BaseModel classes to use as tools
+        tools: Optional list of Pydantic BaseModel classes (or pre-built tool
+            schema dicts) to use as tools
         tool_choice: Optional tool choice control ("auto", "none", "required", or specific tool dict)
         client: Optional pre-configured client, creates new one if None
 
@@ -66,15 +97,16 @@ async def create_openai_completion(
     """
     async with _openai_semaphore:
         if client is None:
-            client = AsyncAzureOpenAI(
-                api_version="2024-12-01-preview",
-                azure_endpoint=endpoint,
-                api_key=subscription_key,
-            )
+            client = get_openai_client()
 
         openai_tools = None
         if tools:
-            openai_tools = [pydantic_function_tool(tool) for tool in tools]
+            # Pre-built schema dicts pass through untouched, so callers can pay
+            # the schema derivation once instead of per request
+            openai_tools = [
+                tool if isinstance(tool, dict) else pydantic_function_tool(tool)
+                for tool in tools
+            ]
 
         request_params = {
             "messages": messages,